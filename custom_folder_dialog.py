@@ -1,26 +1,84 @@
 import os
-from datetime import datetime
+import functools
+from typing import NamedTuple
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QGridLayout, QPushButton, QScrollArea,
                              QLabel, QMessageBox, QLineEdit, QFrame, QDialog,
                              QDialogButtonBox)
-from PyQt6.QtCore import Qt, QTimer, QPoint, QSize, QRectF
-from PyQt6.QtGui import QIcon, QPalette, QColor, QFont, QPainter, QMouseEvent, QPixmap
+from PyQt6.QtCore import (Qt, QTimer, QPoint, QSize, QRectF, QObject, QRunnable,
+                          QThreadPool, pyqtSignal)
+from PyQt6.QtGui import QIcon, QPalette, QColor, QFont, QPainter, QMouseEvent
 from PyQt6.QtSvg import QSvgRenderer
 
+from project_tiles import format_date, get_scaled_icon, clear_scaled_icons, get_default_icon, path_key
+
+# Applied once to the grid's parent so the sheet is parsed a single time
+PROJECT_BUTTON_QSS = """
+    #projectGrid { background: transparent; }
+    ProjectButton { background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #2d2d30, stop:1 #252526);
+                   border: 1px solid #3e3e42; border-radius: 12px; padding: 16px; }
+    ProjectButton:hover { background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #3e3e42, stop:1 #2d2d30);
+                         border: 1px solid #007acc; }
+    ProjectButton:pressed { background: #1e1e1e; border: 1px solid #0098ff; }
+    ProjectButton:checked { background: #007acc; border: 1px solid #0098ff; }
+    QLabel#projectName { font-size: 13px; font-weight: 500; color: #e1e1e1; }
+    QLabel#projectDate { font-size: 10px; color: #888; }
+"""
+
+@functools.lru_cache(maxsize=4096)
 def find_project_icon(project_path):
     try:
-        for item in os.listdir(project_path):
-            if item.lower().endswith('.ico'):
-                return os.path.join(project_path, item)
+        # scandir stops at the first hit instead of materialising the whole listing
+        with os.scandir(project_path) as it:
+            for entry in it:
+                if entry.name.lower().endswith('.ico'):
+                    return entry.path
     except FileNotFoundError:
         pass
     except Exception as e:
         print(f"Error searching for icon in {project_path}: {e}")
     return None
 
+class ProjectMeta(NamedTuple):
+    path: str
+    name: str
+    date_str: str
+
+# Dedicated pool so icon probes overlap without resizing the global one
+_ICON_PROBE_POOL = None
+
+def icon_probe_pool():
+    global _ICON_PROBE_POOL
+    if _ICON_PROBE_POOL is None:
+        _ICON_PROBE_POOL = QThreadPool()
+        _ICON_PROBE_POOL.setMaxThreadCount(8)
+    return _ICON_PROBE_POOL
+
+class IconProbeSignals(QObject):
+    found = pyqtSignal(str, str)
+
+class IconProbe(QRunnable):
+    """Runs find_project_icon for one project off the GUI thread."""
+    def __init__(self, project_path, signals):
+        super().__init__()
+        self.project_path = project_path
+        self.signals = signals
+
+    def run(self):
+        icon_path = find_project_icon(self.project_path)
+        if icon_path:
+            try:
+                self.signals.found.emit(self.project_path, icon_path)
+            except RuntimeError:
+                pass  # Dialog closed before the probe finished
+
+def clear_icon_cache():
+    """Drops memoized icon lookups and pixmaps; called when projects are rescanned."""
+    find_project_icon.cache_clear()
+    clear_scaled_icons()
+
 class ProjectButton(QPushButton):
-    def __init__(self, project_name, project_path, icon_path=None, parent=None):
+    def __init__(self, project_name, project_path, date_str="", icon_path=None, parent=None):
         super().__init__(parent)
         self.setCheckable(True)
         self.setFixedSize(180, 160)
@@ -30,54 +88,58 @@ class ProjectButton(QPushButton):
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.setSpacing(12)
         
-        icon_label = QLabel()
-        icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        if icon_path:
-            pixmap = QPixmap(icon_path)
-            if not pixmap.isNull():
-                icon_label.setPixmap(pixmap.scaled(48, 48, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-            else:
-                icon_label.setText("📁")
-                icon_label.setStyleSheet("font-size: 48px;")
-        else:
-            icon_label.setText("📁")
-            icon_label.setStyleSheet("font-size: 48px;")
-            
-        layout.addWidget(icon_label)
+        self.icon_label = QLabel()
+        self.icon_label.setObjectName("projectIcon")
+        self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.set_icon(icon_path)
+        layout.addWidget(self.icon_label)
         
         name_label = QLabel(project_name)
+        name_label.setObjectName("projectName")
         name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         name_label.setWordWrap(True)
-        name_label.setStyleSheet("font-size: 13px; font-weight: 500; color: #e1e1e1;")
         layout.addWidget(name_label)
-        try:
-            mtime = os.path.getmtime(project_path)
-            date_str = datetime.fromtimestamp(mtime).strftime('%b %d, %Y')
-        except:
-            date_str = ""
         if date_str:
             date_label = QLabel(date_str)
+            date_label.setObjectName("projectDate")
             date_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            date_label.setStyleSheet("font-size: 10px; color: #888;")
             layout.addWidget(date_label)
-        self.setStyleSheet("""
-            ProjectButton { background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #2d2d30, stop:1 #252526);
-                           border: 1px solid #3e3e42; border-radius: 12px; padding: 16px; }
-            ProjectButton:hover { background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #3e3e42, stop:1 #2d2d30);
-                                 border: 1px solid #007acc; }
-            ProjectButton:pressed { background: #1e1e1e; border: 1px solid #0098ff; }
-            ProjectButton:checked { background: #007acc; border: 1px solid #0098ff; }
-        """)
+
+    def set_icon(self, icon_path):
+        pixmap = get_scaled_icon(icon_path) if icon_path else None
+        if pixmap is None or pixmap.isNull():
+            pixmap = get_default_icon()
+        self.icon_label.setPixmap(pixmap)
 
 class CustomFolderDialog(QDialog):
     def __init__(self, projects, ignored_folders=None, parent=None):
         super().__init__(parent)
         self.projects = projects
-        if ignored_folders is None:
-            self.selected_paths_set = set()
-        else:
-            self.selected_paths_set = set(ignored_folders)
+        # Ignored folders keyed by path_key, so an entry spelled with another case or
+        # separator still matches (and can be unchecked from) its project button
+        self._selected = {path_key(p): p for p in (ignored_folders or ())}
+
+        # Stat each folder once up front instead of on every populate
+        self._project_meta = [self._build_meta(p) for p in self.projects]
+
+        # Icons are probed on a thread pool; results are applied in 50 ms batches
+        self._icons = {}
+        self._buttons = {}
+        self._pending_icons = []
+        # Column count the grid is currently laid out for
+        self._cols = 0
+        self._icon_timer = QTimer(self)
+        self._icon_timer.setSingleShot(True)
+        self._icon_timer.setInterval(50)
+        self._icon_timer.timeout.connect(self._flush_icons)
+        self._icon_signals = IconProbeSignals(self)
+        self._icon_signals.found.connect(self._queue_icon)
+
+        # Resizing only re-places the existing buttons in the grid
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(100)
+        self.resize_timer.timeout.connect(self.populate_projects)
         
         self.setWindowTitle("Select Folders to Ignore")
         self.resize(1200, 800)
@@ -101,11 +163,13 @@ class CustomFolderDialog(QDialog):
         """)
 
         scroll_content = QWidget()
-        scroll_content.setStyleSheet("background: transparent;")
+        scroll_content.setObjectName("projectGrid")
+        scroll_content.setStyleSheet(PROJECT_BUTTON_QSS)
         self.grid_layout = QGridLayout(scroll_content)
         self.grid_layout.setSpacing(20)
         self.grid_layout.setContentsMargins(30, 30, 30, 30)
 
+        self._create_buttons(scroll_content)
         self.populate_projects()
         self.scroll_area.setWidget(scroll_content)
         main_layout.addWidget(self.scroll_area)
@@ -117,33 +181,80 @@ class CustomFolderDialog(QDialog):
         
         self.setLayout(main_layout)
 
+        pool = icon_probe_pool()
+        for meta in self._project_meta:
+            pool.start(IconProbe(meta.path, self._icon_signals))
+
+    @staticmethod
+    def _build_meta(project_path):
+        try:
+            date_str = format_date(os.path.getmtime(project_path))
+        except OSError:
+            date_str = ""
+        return ProjectMeta(project_path, os.path.basename(project_path), date_str)
+
+    def _queue_icon(self, project_path, icon_path):
+        self._pending_icons.append((project_path, icon_path))
+        if not self._icon_timer.isActive():
+            self._icon_timer.start()
+
+    def _flush_icons(self):
+        pending, self._pending_icons = self._pending_icons, []
+        for project_path, icon_path in pending:
+            self._icons[project_path] = icon_path
+            btn = self._buttons.get(project_path)
+            if btn is not None:
+                btn.set_icon(icon_path)
+
+    def _create_buttons(self, parent):
+        # One button per project for the dialog's lifetime; populate only moves them
+        for meta in self._project_meta:
+            btn = ProjectButton(meta.name, meta.path, meta.date_str, icon_path=self._icons.get(meta.path), parent=parent)
+            btn.setChecked(path_key(meta.path) in self._selected)
+            btn.toggled.connect(self.project_toggled)
+            self._buttons[meta.path] = btn
+
+    def resizeEvent(self, event):
+        self.resize_timer.start()
+        super().resizeEvent(event)
+
     def populate_projects(self):
-        for i in reversed(range(self.grid_layout.count())): 
-            widget = self.grid_layout.itemAt(i).widget()
-            if widget: widget.setParent(None)
-        
         BUTTON_WIDTH, HORIZONTAL_SPACING = 180, self.grid_layout.horizontalSpacing()
         margins = self.grid_layout.contentsMargins()
         GRID_HORIZONTAL_MARGINS = margins.left() + margins.right()
         
         available_width = self.width() - GRID_HORIZONTAL_MARGINS
         cols = max(1, (available_width + HORIZONTAL_SPACING) // (BUTTON_WIDTH + HORIZONTAL_SPACING))
+        if cols == self._cols:
+            # Same grid shape; nothing to re-add
+            return
+        self._cols = cols
 
-        for i, project_path in enumerate(self.projects):
-            row, col = i // cols, i % cols
-            icon_path = find_project_icon(project_path)
-            btn = ProjectButton(os.path.basename(project_path), project_path, icon_path=icon_path)
-            if project_path in self.selected_paths_set:
-                btn.setChecked(True)
-            btn.toggled.connect(self.project_toggled)
-            self.grid_layout.addWidget(btn, row, col)
+        # Batch the mutations so the grid is laid out once
+        viewport = self.scroll_area.viewport()
+        viewport.setUpdatesEnabled(False)
+        self.grid_layout.setEnabled(False)
+        try:
+            # Detach only; the buttons are recycled, not destroyed
+            item = self.grid_layout.takeAt(0)
+            while item is not None:
+                item = self.grid_layout.takeAt(0)
+
+            for i, meta in enumerate(self._project_meta):
+                row, col = i // cols, i % cols
+                self.grid_layout.addWidget(self._buttons[meta.path], row, col)
+        finally:
+            self.grid_layout.setEnabled(True)
+            viewport.setUpdatesEnabled(True)
+        self.grid_layout.parentWidget().updateGeometry()
 
     def project_toggled(self, checked):
         button = self.sender()
+        key = path_key(button.project_path)
         if checked:
-            self.selected_paths_set.add(button.project_path)
+            self._selected.setdefault(key, button.project_path)
         else:
-            self.selected_paths_set.discard(button.project_path)
+            self._selected.pop(key, None)
 
     def selected_paths(self):
-        return list(self.selected_paths_set)
+        return list(self._selected.values())
@@ -0,0 +1,66 @@
+import os
+from time import localtime
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QFont, QPainter, QPixmap, QPixmapCache
+
+# Helpers shared by the launcher grid and the ignore-folders dialog
+
+def path_key(path):
+    """Comparison key for folder paths (case-insensitive on Windows)."""
+    return os.path.normcase(os.path.normpath(path))
+
+MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+def format_date(mtime):
+    """'%b %d, %Y' without building a datetime or going through strftime."""
+    tm = localtime(mtime)
+    return f"{MONTHS[tm.tm_mon - 1]} {tm.tm_mday:02d}, {tm.tm_year}"
+
+# Scaled icons live in QPixmapCache under "ico48:<path>", so both windows share
+# one budgeted copy per icon. icon_path -> file mtime of the cached pixmap
+# (None when the caller didn't know it).
+_ICON_MTIMES = {}
+
+def get_scaled_icon(icon_path, icon_mtime=None):
+    """48x48 project icon, scaled at most once per file version via QPixmapCache.
+
+    A newer icon_mtime (captured by the scanner, no extra stat) forces a reload;
+    callers without one get whatever version is cached. Returns a null pixmap if
+    the file can't be loaded.
+    """
+    key = f"ico48:{icon_path}"
+    pixmap = QPixmapCache.find(key)
+    if icon_mtime is not None and _ICON_MTIMES.get(icon_path) != icon_mtime:
+        pixmap = None
+    if pixmap is None:
+        pixmap = QPixmap(icon_path)
+        if not pixmap.isNull():
+            pixmap = pixmap.scaled(48, 48, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            QPixmapCache.insert(key, pixmap)
+            _ICON_MTIMES[icon_path] = icon_mtime
+    return pixmap
+
+def clear_scaled_icons():
+    """Evicts every pixmap loaded through get_scaled_icon."""
+    for icon_path in _ICON_MTIMES:
+        QPixmapCache.remove(f"ico48:{icon_path}")
+    _ICON_MTIMES.clear()
+
+# Folder-emoji fallbacks keyed by pixel size
+_DEFAULT_ICONS = {}
+
+def get_default_icon(size=56):
+    """Folder emoji rendered once per size and shared by every icon-less tile."""
+    pixmap = _DEFAULT_ICONS.get(size)
+    if pixmap is None:
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        font = QFont()
+        font.setPixelSize(size * 11 // 14)
+        painter.setFont(font)
+        painter.setPen(QColor("#d4d4d4"))
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "📁")
+        painter.end()
+        _DEFAULT_ICONS[size] = pixmap
+    return pixmap
@@ -0,0 +1,14 @@
+import os
+import sys
+
+import pytest
+
+# The app modules live at the repo root, next to this tests/ folder
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+@pytest.fixture(scope="session")
+def app():
+    QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
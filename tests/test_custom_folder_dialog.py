@@ -0,0 +1,39 @@
+import os
+
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+
+from custom_folder_dialog import CustomFolderDialog
+
+
+def other_spelling(path):
+    # Same folder, different string: an extra "." segment, plus other case on Windows
+    head, tail = os.path.split(path)
+    spelled = os.path.join(head, '.', tail)
+    return spelled.swapcase() if os.name == 'nt' else spelled
+
+
+def test_uncheck_removes_differently_spelled_ignore_entry(app, tmp_path):
+    project = tmp_path / "Project"
+    project.mkdir()
+    ignored = other_spelling(str(project))
+    assert ignored != str(project)
+
+    dialog = CustomFolderDialog([str(project)], [ignored])
+    button = dialog._buttons[str(project)]
+    assert button.isChecked()
+
+    button.setChecked(False)
+    assert dialog.selected_paths() == []
+
+
+def test_unrelated_ignore_entries_are_kept(app, tmp_path):
+    project = tmp_path / "Project"
+    project.mkdir()
+    elsewhere = str(tmp_path / "Elsewhere")
+
+    dialog = CustomFolderDialog([str(project)], [elsewhere])
+    dialog._buttons[str(project)].setChecked(True)
+
+    assert sorted(dialog.selected_paths()) == sorted([elsewhere, str(project)])
@@ -0,0 +1,93 @@
+import json
+import os
+
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+
+import vscode_project_launcher as launcher
+
+
+@pytest.fixture
+def appdata(tmp_path, monkeypatch):
+    """Fake %APPDATA% with an empty VS Code storage.json; cwd holds the app's caches."""
+    storage_dir = tmp_path / "appdata" / "Code" / "User" / "globalStorage"
+    storage_dir.mkdir(parents=True)
+    monkeypatch.setenv("APPDATA", str(tmp_path / "appdata"))
+    monkeypatch.chdir(tmp_path)
+    return storage_dir / "storage.json"
+
+
+def write_storage(storage_path, folders):
+    workspaces = {launcher.FILE_URI_PREFIX + str(folder): {} for folder in folders}
+    storage_path.write_text(json.dumps({"profileAssociations": {"workspaces": workspaces}}), encoding="utf-8")
+
+
+def run_scan(ignored=()):
+    worker = launcher.ProjectScannerWorker(list(ignored), vscode_path="code")
+    results = []
+    worker.finished.connect(lambda projects, vscode_path: results.append(projects))
+    worker.run()
+    assert len(results) == 1
+    return results[0]
+
+
+def test_non_ascii_names_round_trip_through_the_cache(app, tmp_path, appdata):
+    project = tmp_path / "Café"
+    project.mkdir()
+    write_storage(appdata, [project])
+
+    scanned = run_scan()
+    assert [p['name'] for p in scanned] == ["Café"]
+
+    window = launcher.VSCodeLauncher()
+    window.load_from_cache()
+    assert [p['name'] for p in window.projects_data] == ["Café"]
+    assert window.projects_data[0]['path'] == scanned[0]['path']
+
+
+def refuse_storage_parse(monkeypatch):
+    def boom(self, storage_path):
+        raise AssertionError("storage.json should not be parsed")
+    monkeypatch.setattr(launcher.ProjectScannerWorker, "load_workspace_uris", boom)
+
+
+def test_unchanged_storage_returns_cached_projects_without_parsing(app, tmp_path, appdata, monkeypatch):
+    project = tmp_path / "alpha"
+    project.mkdir()
+    write_storage(appdata, [project])
+    first = run_scan()
+
+    refuse_storage_parse(monkeypatch)
+    # The fast path must not re-probe folders either
+    monkeypatch.setattr(launcher.ProjectScannerWorker, "stat_projects", lambda self, paths: pytest.fail("rescanned"))
+    assert run_scan() == first
+
+
+def test_changed_ignore_list_rescans_with_sidecar_uris(app, tmp_path, appdata, monkeypatch):
+    alpha, beta = tmp_path / "alpha", tmp_path / "beta"
+    alpha.mkdir()
+    beta.mkdir()
+    write_storage(appdata, [alpha, beta])
+    assert sorted(p['name'] for p in run_scan()) == ["alpha", "beta"]
+
+    refuse_storage_parse(monkeypatch)
+    assert [p['name'] for p in run_scan(ignored=[str(alpha)])] == ["beta"]
+
+
+@pytest.mark.parametrize("damage", ["missing", "corrupt"])
+def test_unusable_project_cache_forces_full_scan(app, tmp_path, appdata, damage):
+    project = tmp_path / "alpha"
+    project.mkdir()
+    write_storage(appdata, [project])
+    first = run_scan()
+
+    if damage == "missing":
+        os.remove(launcher.CACHE_FILE)
+    else:
+        with open(launcher.CACHE_FILE, 'w') as f:
+            f.write("{not json")
+
+    assert run_scan() == first
+    with open(launcher.CACHE_FILE, 'rb') as f:
+        assert json.loads(f.read()) == first
@@ -0,0 +1,53 @@
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+
+import vscode_project_launcher as launcher
+
+
+@pytest.fixture
+def window(app, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    window = launcher.VSCodeLauncher()
+    window.resize(1200, 800)
+    window.show()
+    app.processEvents()
+    projects = [{"path": f"/projects/p{i}", "name": f"p{i}", "mtime": 1_700_000_000 + i, "icon": None}
+                for i in range(600)]
+    window.set_projects_data(projects)
+    window.populate_projects()
+    app.processEvents()
+    yield window
+    window.hide()
+
+
+def max_window_tiles(window):
+    row_height = launcher.TILE_HEIGHT + launcher.GRID_SPACING
+    visible_rows = window.scroll_area.viewport().height() // row_height + 2
+    return (visible_rows + 2 * launcher.OVERSCAN_ROWS) * window._cols
+
+
+def test_only_rows_near_the_viewport_are_bound(app, window):
+    bar = window.scroll_area.verticalScrollBar()
+    bar.setValue(bar.maximum())
+    app.processEvents()
+    window._relayout()
+    app.processEvents()
+
+    assert 0 < len(window._bound) <= max_window_tiles(window)
+    assert max(window._bound) == 599
+    assert all(btn.isVisible() for btn in window._bound.values())
+    assert not any(btn.isVisible() for btn in window._spare)
+
+
+def test_scrolling_back_up_recycles_buttons(app, window):
+    bar = window.scroll_area.verticalScrollBar()
+    bar.setValue(bar.maximum())
+    app.processEvents()
+    created = len(window._bound) + len(window._spare)
+
+    bar.setValue(0)
+    app.processEvents()
+
+    assert min(window._bound) == 0
+    assert len(window._bound) + len(window._spare) == created
@@ -1,113 +1,274 @@
 import os
+import stat
+import functools
 import json
 import subprocess
 import sys
 import ctypes
 from urllib.parse import unquote
+from concurrent.futures import ThreadPoolExecutor
 import logging
-from datetime import datetime
-from time import sleep
+from logging.handlers import RotatingFileHandler
+from time import sleep, monotonic
+
+# Optional faster JSON parser for VS Code's (potentially large) storage.json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # PyQt Imports
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
-                             QHBoxLayout, QGridLayout, QPushButton, QScrollArea,
+                             QHBoxLayout, QGridLayout, QPushButton, QAbstractButton, QScrollArea,
                              QLabel, QMessageBox, QLineEdit, QFrame, QSystemTrayIcon,
                              QMenu)
 from PyQt6.QtCore import Qt, QTimer, QPoint, QSize, QRectF, QThread, pyqtSignal, QEventLoop
-from PyQt6.QtGui import QIcon, QPalette, QColor, QFont, QPainter, QMouseEvent, QPixmap, QAction
+from PyQt6.QtGui import (QIcon, QPalette, QColor, QFont, QFontMetrics, QPainter, QPen, QLinearGradient,
+                         QMouseEvent, QPixmap, QPixmapCache, QAction)
 from PyQt6.QtSvg import QSvgRenderer
 from PyQt6.QtNetwork import QLocalServer, QLocalSocket
 
+# svg_icons is the single source of the icon markup
+from svg_icons import SVG_ICONS
+# Date formatting and tile icons are shared with the folder dialog
+from project_tiles import format_date, get_scaled_icon, get_default_icon, path_key
+
 # Attempt imports for your custom modules
 try:
-    from svg_icons import SVG_ICONS
-    from custom_folder_dialog import CustomFolderDialog
+    from custom_folder_dialog import CustomFolderDialog, clear_icon_cache
 except ImportError:
     # Fallback if running standalone or missing files
-    SVG_ICONS = {} 
     class CustomFolderDialog: pass
-
-logging.basicConfig(filename='launcher.log', level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s', filemode='w')
+    def clear_icon_cache(): pass
 
 CACHE_FILE = 'project_cache.json'
 CONFIG_FILE = 'launcher_config.json'
+STORAGE_CACHE_FILE = 'storage_cache.json'
 SOCKET_NAME = 'VSCodeLauncherInstance'
+MUTEX_NAME = 'VSCodeLauncherInstance_Mutex'
+ERROR_ALREADY_EXISTS = 183
+# How long a second launch keeps trying to reach a still-starting first instance
+SHOW_RETRY_SECONDS = 3.0
+FILE_URI_PREFIX = 'file:///'
+FILE_URI_PREFIX_LEN = len(FILE_URI_PREFIX)
+
+# Style sheets are applied once to a parent widget so Qt parses them a single
+# time instead of once per button.
+# ProjectButton paints itself, so the grid only needs a transparent backdrop
+GRID_QSS = "#projectGrid { background: transparent; }"
+
+# Project grid geometry. Tiles are placed by hand (no layout) so only the rows
+# around the viewport need live buttons.
+TILE_WIDTH, TILE_HEIGHT = 180, 160
+GRID_SPACING = 20
+GRID_MARGIN = 30
+# Rows bound above and below the visible ones so scrolling has something to show
+OVERSCAN_ROWS = 2
+
+TITLE_BUTTON_QSS = """
+    TitleBarButton { background-color: transparent; border: none; border-radius: 5px; }
+    TitleBarButton:hover { background-color: rgba(255, 255, 255, 0.2); }
+    TitleBarButton:pressed { background-color: rgba(255, 255, 255, 0.1); }
+    TitleBarButton#closeBtn:hover { background-color: #E81123; }
+"""
+
+# Window chrome. Maximizing flips the "maximized" property and re-polishes
+# instead of swapping style sheet strings.
+WINDOW_QSS = """
+    #backgroundFrame { background-color: #1e1e1e; border-radius: 15px; }
+    #backgroundFrame[maximized="true"] { border-radius: 0px; }
+    #header { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #007acc, stop:1 #005a9e);
+              border-top-left-radius: 14px; border-top-right-radius: 14px; }
+    #header[maximized="true"] { border-top-left-radius: 0px; border-top-right-radius: 0px; }
+""" + TITLE_BUTTON_QSS
+
+# --- VS CODE DISCOVERY ---
+def load_vscode_path_from_config():
+    if os.path.exists(CONFIG_FILE):
+        try:
+            with open(CONFIG_FILE, 'r') as f:
+                config = json.load(f)
+                path = config.get('vscode_path')
+                if path and os.path.exists(path):
+                    return path
+        except:
+            pass
+    return None
+
+@functools.lru_cache(maxsize=1)
+def find_vscode_executable():
+    """Resolved once per process; call find_vscode_executable.cache_clear() to re-detect."""
+    # Check config first
+    path = load_vscode_path_from_config()
+    if path:
+        return path
+
+    logging.info("Searching for VS Code executable...")
+    appdata_path = os.environ.get('LOCALAPPDATA', '')
+    program_files = os.environ.get('ProgramFiles', '')
+    program_files_x86 = os.environ.get('ProgramFiles(x86)', '')
+    possible_paths = [
+        os.path.join(appdata_path, 'Programs', 'Microsoft VS Code', 'Code.exe'),
+        os.path.join(appdata_path, 'Programs', 'Microsoft VS Code', 'bin', 'code.cmd'),
+        os.path.join(program_files, 'Microsoft VS Code', 'Code.exe'),
+        os.path.join(program_files, 'Microsoft VS Code', 'bin', 'code.cmd'),
+    ]
+    if program_files_x86:
+        possible_paths.extend([
+            os.path.join(program_files_x86, 'Microsoft VS Code', 'Code.exe'),
+        ])
+    
+    found_path = None
+    for path in possible_paths:
+        if os.path.exists(path):
+            found_path = path
+            break
+    
+    if not found_path:
+        try:
+            result = subprocess.run(['where', 'code'], capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
+            first_path = result.stdout.strip().splitlines()[0]
+            if os.path.exists(first_path):
+                found_path = first_path
+        except:
+            pass
+    
+    if found_path:
+        with open(CONFIG_FILE, 'w') as f:
+            json.dump({'vscode_path': found_path}, f)
+    
+    return found_path
+
+def tile_state(projects):
+    """What a project tile shows, per project; equal lists need no rebind."""
+    return [(p['path'], p.get('icon'), p.get('icon_mtime'), p.get('mtime')) for p in projects]
 
 # --- WORKER THREAD FOR BACKGROUND SCANNING ---
 class ProjectScannerWorker(QThread):
     finished = pyqtSignal(list, str) 
 
-    def __init__(self, ignored_folders):
+    def __init__(self, ignored_folders, vscode_path=None):
         super().__init__()
-        self.ignored_folders = ignored_folders
+        # Normalized once so each membership test is O(1) and case-insensitive on Windows
+        self.ignored_folders = frozenset(path_key(p) for p in ignored_folders)
+        # Known path from the launcher; discovery only runs when it is missing
+        self.vscode_path = vscode_path
 
-    def find_vscode_executable(self):
-        # Check config first
-        if os.path.exists(CONFIG_FILE):
-            try:
-                with open(CONFIG_FILE, 'r') as f:
-                    config = json.load(f)
-                    path = config.get('vscode_path')
-                    if path and os.path.exists(path):
-                        return path
-            except:
-                pass
+    COMMON_ICON_NAMES = ('favicon.ico', 'icon.ico', 'logo.ico', 'app.ico')
 
-        logging.info("Searching for VS Code executable...")
-        appdata_path = os.environ.get('LOCALAPPDATA', '')
-        program_files = os.environ.get('ProgramFiles', '')
-        program_files_x86 = os.environ.get('ProgramFiles(x86)', '')
-        possible_paths = [
-            os.path.join(appdata_path, 'Programs', 'Microsoft VS Code', 'Code.exe'),
-            os.path.join(appdata_path, 'Programs', 'Microsoft VS Code', 'bin', 'code.cmd'),
-            os.path.join(program_files, 'Microsoft VS Code', 'Code.exe'),
-            os.path.join(program_files, 'Microsoft VS Code', 'bin', 'code.cmd'),
-        ]
-        if program_files_x86:
-            possible_paths.extend([
-                os.path.join(program_files_x86, 'Microsoft VS Code', 'Code.exe'),
-            ])
-        
-        found_path = None
-        for path in possible_paths:
-            if os.path.exists(path):
-                found_path = path
-                break
-        
-        if not found_path:
+    def find_project_icon(self, project_path):
+        """Returns (icon_path, icon_mtime), or (None, None) if the folder has no icon."""
+        # One scandir pass finds both a common icon name and the .ico fallback
+        common = {}
+        fallback = None
+        try:
+            with os.scandir(project_path) as it:
+                for i, entry in enumerate(it):
+                    name = entry.name.lower()
+                    if name in self.COMMON_ICON_NAMES:
+                        common[name] = entry
+                    elif fallback is None and i < 50 and name.endswith('.ico'):
+                        fallback = entry
+            entry = next((common[n] for n in self.COMMON_ICON_NAMES if n in common), fallback)
+            if entry is None:
+                return None, None
+            # The mtime keys the pixmap cache so an edited icon is reloaded
+            return entry.path, entry.stat().st_mtime
+        except OSError:
+            return None, None
+
+    def stat_projects(self, paths):
+        """Yields (path, stat_result) for each path that is a directory.
+
+        Paths are grouped by parent so each parent is listed once with scandir;
+        the DirEntry data replaces a separate stat per project (free on Windows).
+        """
+        by_parent = {}
+        for path in paths:
+            by_parent.setdefault(os.path.dirname(path), []).append(path)
+
+        for parent, children in by_parent.items():
             try:
-                result = subprocess.run(['where', 'code'], capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
-                first_path = result.stdout.strip().splitlines()[0]
-                if os.path.exists(first_path):
-                    found_path = first_path
-            except:
-                pass
-        
-        if found_path:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump({'vscode_path': found_path}, f)
-        
-        return found_path
+                with os.scandir(parent) as it:
+                    entries = {os.path.normcase(e.name): e for e in it}
+            except OSError:
+                entries = {}
+            for path in children:
+                entry = entries.get(os.path.normcase(os.path.basename(path)))
+                try:
+                    if entry is not None:
+                        if entry.is_dir():
+                            yield path, entry.stat()
+                    else:
+                        # Not in the listing (e.g. a drive root): fall back to stat
+                        st = os.stat(path)
+                        if stat.S_ISDIR(st.st_mode):
+                            yield path, st
+                except OSError:
+                    continue
+
+    def _probe_project(self, path_and_stat):
+        path, st = path_and_stat
+        # Reuse the last icon lookup while the folder's listing is unchanged (same
+        # mtime as the cached entry, which was probed at that mtime). A
+        # "none" result stays valid, but a found icon can be rewritten in place
+        # without touching the folder mtime, so its own mtime is re-read.
+        prev = self._prev_cache.get(path)
+        if prev is None or prev.get('mtime') != st.st_mtime:
+            icon, icon_mtime = self.find_project_icon(path)
+        elif not prev.get('icon'):
+            icon, icon_mtime = None, None
+        else:
+            icon = prev['icon']
+            try:
+                icon_mtime = os.stat(icon).st_mtime
+            except OSError:
+                icon, icon_mtime = self.find_project_icon(path)
+        return {
+            "path": path,
+            "name": os.path.basename(path),
+            "mtime": st.st_mtime,
+            "icon": icon,
+            "icon_mtime": icon_mtime
+        }
+
+    def load_previous_cache(self):
+        """Reads CACHE_FILE once; returns (raw bytes, list of project dicts)."""
+        try:
+            with open(CACHE_FILE, 'rb') as f:
+                raw = f.read()
+            projects = json.loads(raw)
+            if not isinstance(projects, list):
+                return b'', []
+            return raw, projects
+        except (OSError, ValueError):
+            return b'', []
+
+    def load_storage_sidecar(self):
+        """Last scan's storage.json signature, ignore list and workspace URIs."""
+        try:
+            with open(STORAGE_CACHE_FILE, 'r') as f:
+                sidecar = json.load(f)
+            return sidecar if isinstance(sidecar, dict) else {}
+        except (OSError, ValueError):
+            return {}
 
-    def find_project_icon(self, project_path):
-        common_names = ['favicon.ico', 'icon.ico', 'logo.ico', 'app.ico']
+    def save_storage_sidecar(self, sidecar):
         try:
-            # Quick check for common names first
-            for name in common_names:
-                p = os.path.join(project_path, name)
-                if os.path.exists(p):
-                    return p
-            # Fallback to scanning dir (limit 50 files)
-            files = os.listdir(project_path)
-            for item in files[:50]: 
-                if item.lower().endswith('.ico'):
-                    return os.path.join(project_path, item)
-        except:
-            pass
-        return None
+            with open(STORAGE_CACHE_FILE, 'w') as f:
+                json.dump(sidecar, f)
+        except OSError as e:
+            logging.error("Storage cache write failed: %s", e)
+
+    def load_workspace_uris(self, storage_path):
+        """Parses the workspace URIs out of storage.json."""
+        with open(storage_path, 'rb') as f:
+            data = f.read()
+        storage_data = orjson.loads(data) if orjson else json.loads(data.decode('utf-8'))
+        return list(storage_data.get('profileAssociations', {}).get('workspaces', {}).keys())
 
     def run(self):
-        vscode_path = self.find_vscode_executable()
+        vscode_path = self.vscode_path or find_vscode_executable()
         try:
             possible_paths = [
                 os.path.join(os.environ['APPDATA'], 'Code', 'User', 'globalStorage', 'storage.json'),
@@ -124,141 +285,311 @@ class ProjectScannerWorker(QThread):
                 self.finished.emit([], vscode_path)
                 return
 
-            with open(storage_path, 'r', encoding='utf-8') as f:
-                storage_data = json.load(f)
-            
-            project_uris = list(storage_data.get('profileAssociations', {}).get('workspaces', {}).keys())
-            final_projects = []
+            # VS Code only rewrites storage.json when workspace history changes, so an
+            # identical (mtime_ns, size) plus the same ignore list means the last scan
+            # is still current and project_cache.json can be handed back as-is.
+            # Trade-off: this also skips the per-project date and icon refresh in
+            # _probe_project until storage.json changes again.
+            st = os.stat(storage_path)
+            sig = [st.st_mtime_ns, st.st_size]
+            ignored = sorted(self.ignored_folders)
+            sidecar = self.load_storage_sidecar()
+            storage_unchanged = sidecar.get('path') == storage_path and sidecar.get('sig') == sig
+            prev_bytes, prev_projects = self.load_previous_cache()
+
+            if storage_unchanged and sidecar.get('ignored') == ignored and prev_bytes:
+                self.finished.emit(prev_projects, vscode_path)
+                return
+
+            if storage_unchanged and 'uris' in sidecar:
+                project_uris = sidecar['uris']
+            else:
+                project_uris = self.load_workspace_uris(storage_path)
+            self._prev_cache = {p['path']: p for p in prev_projects if 'path' in p}
+            candidates = []
+            seen = set()
             
             for uri in project_uris:
-                if uri.startswith('file:///'):
-                    path = unquote(uri[8:]).replace('/', '\\\\')
-                    
-                    if path in self.ignored_folders:
+                if uri.startswith(FILE_URI_PREFIX):
+                    path = uri[FILE_URI_PREFIX_LEN:]
+                    # VS Code escapes the drive colon (file:///c%3A/...), so this decodes
+                    # nearly every Windows entry; unquote returns early when there's no '%'
+                    path = unquote(path)
+                    path = os.path.normpath(path)
+                    key = path_key(path)
+
+                    if key in self.ignored_folders:
+                        continue
+
+                    # VS Code can list one folder under several casings; keep the first
+                    if key in seen:
                         continue
+                    seen.add(key)
+                    candidates.append(path)
 
-                    if os.path.isdir(path):
-                        mtime = os.path.getmtime(path)
-                        icon = self.find_project_icon(path)
-                        final_projects.append({
-                            "path": path,
-                            "name": os.path.basename(path),
-                            "mtime": mtime,
-                            "icon": icon
-                        })
+            # Icon probing is independent per folder and I/O bound, so overlap it
+            with ThreadPoolExecutor(max_workers=16) as ex:
+                final_projects = list(ex.map(self._probe_project, self.stat_projects(candidates)))
 
             final_projects.sort(key=lambda x: x['mtime'], reverse=True)
             
-            with open(CACHE_FILE, 'w') as f:
-                json.dump(final_projects, f)
+            # Scans run on every tray activation; only touch the disk when something changed
+            new_bytes = orjson.dumps(final_projects) if orjson else json.dumps(final_projects).encode('utf-8')
+            if new_bytes != prev_bytes:
+                with open(CACHE_FILE, 'wb') as f:
+                    f.write(new_bytes)
+
+            # Recorded only after the cache is written, so a failed scan is retried
+            new_sidecar = {'path': storage_path, 'sig': sig, 'ignored': ignored, 'uris': project_uris}
+            if new_sidecar != sidecar:
+                self.save_storage_sidecar(new_sidecar)
 
             self.finished.emit(final_projects, vscode_path)
 
         except Exception as e:
-            logging.error(f"Scanner error: {e}")
+            logging.error("Scanner error: %s", e)
             self.finished.emit([], vscode_path)
 
 # --- UI CLASSES ---
 
+# Rasterized title bar icons keyed by (icon_name, device_pixel_ratio)
+_SVG_PIXMAP_CACHE = {}
+
+def render_svg_icon(name, dpr, size=16):
+    """Rasterizes an SVG icon once per name/DPR so repaints are a plain blit."""
+    key = (name, dpr)
+    pixmap = _SVG_PIXMAP_CACHE.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(QSize(size, size) * dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        if name in SVG_ICONS:
+            renderer = QSvgRenderer(SVG_ICONS[name].encode('utf-8'))
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            renderer.render(painter, QRectF(pixmap.rect()))
+            painter.end()
+        pixmap.setDevicePixelRatio(dpr)
+        _SVG_PIXMAP_CACHE[key] = pixmap
+    return pixmap
+
+# Multi-resolution title bar icons keyed by icon_name
+_SVG_ICON_CACHE = {}
+
+def svg_icon(name):
+    """QIcon carrying 1x and 2x rasters so Qt picks the right one per screen."""
+    icon = _SVG_ICON_CACHE.get(name)
+    if icon is None:
+        icon = QIcon()
+        for dpr in (1, 2):
+            icon.addPixmap(render_svg_icon(name, dpr))
+        _SVG_ICON_CACHE[name] = icon
+    return icon
+
 class TitleBarButton(QPushButton):
     def __init__(self, icon_name, parent=None):
         super().__init__(parent)
         self.setFixedSize(40, 30)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._renderer = QSvgRenderer()
+        self.setIconSize(QSize(16, 16))
         self.setIconName(icon_name)
 
     def setIconName(self, name):
+        # QPushButton's own paint path blits the cached pixmap; no custom paintEvent.
+        # The widget isn't on a screen yet here, so ship both DPRs and let Qt choose.
         self._icon_name = name
-        if name in SVG_ICONS:
-            self._renderer.load(SVG_ICONS[self._icon_name].encode('utf-8'))
-        self.update()
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        icon_size = self.iconSize()
-        rect = self.rect()
-        x = (rect.width() - icon_size.width()) / 2
-        y = (rect.height() - icon_size.height()) / 2
-        target_rect = QRectF(x, y, icon_size.width(), icon_size.height())
-        self._renderer.render(painter, target_rect)
-
-    def iconSize(self):
-        return QSize(16, 16)
-
-class ProjectButton(QPushButton):
-    def __init__(self, project_data, parent=None):
+        self.setIcon(svg_icon(name))
+
+class ProjectButton(QAbstractButton):
+    """Pooled project tile drawn as two blits: a shared card background and a
+    per-button content pixmap (icon, name, date) rendered once per rebind."""
+    BACKGROUND = (QColor("#2d2d30"), QColor("#252526"))
+    BACKGROUND_HOVER = (QColor("#3e3e42"), QColor("#2d2d30"))
+    BACKGROUND_PRESSED = QColor("#1e1e1e")
+    BORDER, BORDER_HOVER, BORDER_PRESSED = QColor("#3e3e42"), QColor("#007acc"), QColor("#0098ff")
+    NAME_COLOR, DATE_COLOR = QColor("#e1e1e1"), QColor("#888888")
+    PADDING, SPACING = 16, 12
+
+    # Fonts need a QApplication, so they are created with the first button
+    _name_font = None
+    _date_font = None
+    # Card backgrounds are identical for every tile: keyed by (state, dpr)
+    _card_cache = {}
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.project_path = project_data['path']
+        if ProjectButton._name_font is None:
+            ProjectButton._name_font = QFont(self.font())
+            ProjectButton._name_font.setPixelSize(13)
+            ProjectButton._name_font.setWeight(QFont.Weight.Medium)
+            ProjectButton._date_font = QFont(self.font())
+            ProjectButton._date_font.setPixelSize(10)
+
+        self.project_path = None
+        self._icon_key = None
+        self._mtime = None
+        self._full_name = None
+        self._name = ""
+        self._date = ""
+        self._icon_pm = get_default_icon()
+        self._content_pm = None
         self.setFixedSize(180, 160)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
-        layout = QVBoxLayout(self)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.setSpacing(12)
-        
-        icon_label = QLabel()
-        icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
+    def sizeHint(self):
+        return QSize(180, 160)
+
+    def update_for(self, project_data):
+        self.project_path = project_data['path']
+        changed = False
+        name = project_data['name']
+        if name != self._full_name:
+            self._full_name = name
+            self._name = QFontMetrics(self._name_font).elidedText(
+                name, Qt.TextElideMode.ElideRight, self.width() - 2 * self.PADDING)
+            self.setToolTip(name if self._name != name else "")
+            changed = True
+
+        # Only touch the pixmap/date when they actually changed for this slot
         icon_path = project_data.get('icon')
-        if icon_path and os.path.exists(icon_path):
-            pixmap = QPixmap(icon_path)
-            if not pixmap.isNull():
-                icon_label.setPixmap(pixmap.scaled(48, 48, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        icon_mtime = project_data.get('icon_mtime')
+        if (icon_path, icon_mtime) != self._icon_key:
+            self._icon_key = (icon_path, icon_mtime)
+            pixmap = get_scaled_icon(icon_path, icon_mtime) if icon_path else None
+            self._icon_pm = pixmap if pixmap is not None and not pixmap.isNull() else get_default_icon()
+            changed = True
+
+        mtime = project_data.get('mtime')
+        if mtime != self._mtime:
+            self._mtime = mtime
+            self._date = format_date(mtime) if mtime else ""
+            changed = True
+
+        if changed:
+            self._content_pm = None
+            self.update()
+
+    def enterEvent(self, event):
+        self.update()
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        self.update()
+        super().leaveEvent(event)
+
+    def _card(self, state, dpr):
+        key = (state, dpr)
+        pixmap = self._card_cache.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(self.size() * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            if state == 'pressed':
+                painter.setBrush(self.BACKGROUND_PRESSED)
+                painter.setPen(QPen(self.BORDER_PRESSED, 1))
             else:
-                self._set_default_icon(icon_label)
-        else:
-            self._set_default_icon(icon_label)
-            
-        layout.addWidget(icon_label)
-        
-        name_label = QLabel(project_data['name'])
-        name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        name_label.setWordWrap(True)
-        name_label.setStyleSheet("font-size: 13px; font-weight: 500; color: #e1e1e1;")
-        layout.addWidget(name_label)
-
-        if project_data.get('mtime'):
-            date_str = datetime.fromtimestamp(project_data['mtime']).strftime('%b %d, %Y')
-            date_label = QLabel(date_str)
-            date_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            date_label.setStyleSheet("font-size: 10px; color: #888;")
-            layout.addWidget(date_label)
-
-        self.setStyleSheet("""
-            ProjectButton { background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #2d2d30, stop:1 #252526);
-                           border: 1px solid #3e3e42; border-radius: 12px; padding: 16px; }
-            ProjectButton:hover { background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #3e3e42, stop:1 #2d2d30);
-                                 border: 1px solid #007acc; }
-            ProjectButton:pressed { background: #1e1e1e; border: 1px solid #0098ff; }
-        """)
+                top, bottom = self.BACKGROUND_HOVER if state == 'hover' else self.BACKGROUND
+                gradient = QLinearGradient(0, 0, 0, self.height())
+                gradient.setColorAt(0, top)
+                gradient.setColorAt(1, bottom)
+                painter.setBrush(gradient)
+                painter.setPen(QPen(self.BORDER_HOVER if state == 'hover' else self.BORDER, 1))
+            painter.drawRoundedRect(QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), 12, 12)
+            painter.end()
+            self._card_cache[key] = pixmap
+        return pixmap
+
+    def _render_content(self, dpr):
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Icon, name and date stacked and centred vertically
+        icon_w = round(self._icon_pm.width() / self._icon_pm.devicePixelRatio())
+        icon_h = round(self._icon_pm.height() / self._icon_pm.devicePixelRatio())
+        name_h = QFontMetrics(self._name_font).height()
+        date_h = QFontMetrics(self._date_font).height() if self._date else 0
+        content_h = icon_h + self.SPACING + name_h + (self.SPACING + date_h if self._date else 0)
+        y = (self.height() - content_h) // 2
+
+        painter.drawPixmap((self.width() - icon_w) // 2, y, self._icon_pm)
+        y += icon_h + self.SPACING
+
+        text_w = self.width() - 2 * self.PADDING
+        painter.setFont(self._name_font)
+        painter.setPen(self.NAME_COLOR)
+        painter.drawText(self.PADDING, y, text_w, name_h, Qt.AlignmentFlag.AlignCenter, self._name)
+
+        if self._date:
+            y += name_h + self.SPACING
+            painter.setFont(self._date_font)
+            painter.setPen(self.DATE_COLOR)
+            painter.drawText(self.PADDING, y, text_w, date_h, Qt.AlignmentFlag.AlignCenter, self._date)
+        painter.end()
+        return pixmap
 
-    def _set_default_icon(self, label):
-        label.setText("📁")
-        label.setStyleSheet("font-size: 48px; color: #d4d4d4;")
+    def paintEvent(self, event):
+        dpr = self.devicePixelRatioF()
+        if self._content_pm is None or self._content_pm.devicePixelRatio() != dpr:
+            self._content_pm = self._render_content(dpr)
+
+        state = 'pressed' if self.isDown() else 'hover' if self.underMouse() else 'normal'
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._card(state, dpr))
+        painter.drawPixmap(0, 0, self._content_pm)
 
 class VSCodeLauncher(QMainWindow):
+    # Tray icon file is decoded once per process, not per setup
+    _TRAY_ICON = None
+
     def __init__(self):
         super().__init__()
         self.ignored_folders = self.load_ignored_folders()
         self.projects_data = []
-        self.vscode_exe = None
+        # Column-wise views of projects_data, rebuilt only when it changes
+        self._paths = []
+        self._name_keys = []
+        # Last search and the row indices it matched, for incremental narrowing
+        self._last_needle = None
+        self._filtered_idx = None
+        # Grid is virtualized: project index -> button for rows near the viewport,
+        # plus unbound buttons kept for reuse
+        self._bound = {}
+        self._spare = []
+        self._shown_projects = []
+        self._cols = 1
+        # Read once from config; scans reuse it instead of re-discovering
+        self.vscode_exe = load_vscode_path_from_config()
         self.drag_pos = QPoint()
+        # Created after the first frame; see setup_tray
+        self.tray_icon = None
+
+        # Collapses a burst of keystrokes into a single grid refresh
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(80)
+        self.search_timer.timeout.connect(self._apply_filter)
         
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(100)
+        self.resize_timer.timeout.connect(self._relayout)
+
         self.init_ui()
+        # Tray, cached projects and the scan all wait until the empty shell is up
+        QTimer.singleShot(0, self._after_show)
+
+    def _after_show(self):
         self.setup_tray()
-        
         # Load cache + Start Scan
         self.load_from_cache()
         self.start_scan()
 
-        self.resize_timer = QTimer(self)
-        self.resize_timer.setSingleShot(True)
-        self.resize_timer.setInterval(100)
-        self.resize_timer.timeout.connect(self.populate_projects)
-
     def start_scan(self):
-        self.scanner = ProjectScannerWorker(self.ignored_folders)
+        self.scanner = ProjectScannerWorker(self.ignored_folders, self.vscode_exe)
         self.scanner.finished.connect(self.on_scan_finished)
         self.scanner.start()
 
@@ -271,22 +602,33 @@ class VSCodeLauncher(QMainWindow):
                 pass
 
     def setup_tray(self):
+        if self.tray_icon is not None:
+            return
+        if VSCodeLauncher._TRAY_ICON is None:
+            VSCodeLauncher._TRAY_ICON = QIcon("VSCode Hub_icon.ico")
         self.tray_icon = QSystemTrayIcon(self)
-        self.tray_icon.setIcon(QIcon("VSCode Hub_icon.ico")) 
+        self.tray_icon.setIcon(VSCodeLauncher._TRAY_ICON)
         
         tray_menu = QMenu()
         show_action = QAction("Show", self)
         show_action.triggered.connect(self.show_window)
+        redetect_action = QAction("Re-detect VS Code", self)
+        redetect_action.triggered.connect(self.redetect_vscode)
         quit_action = QAction("Quit", self)
         quit_action.triggered.connect(self.force_close)
         
         tray_menu.addAction(show_action)
+        tray_menu.addAction(redetect_action)
         tray_menu.addAction(quit_action)
         self.tray_icon.setContextMenu(tray_menu)
         self.tray_icon.show()
         
         self.tray_icon.activated.connect(self.on_tray_activated)
 
+    def redetect_vscode(self):
+        find_vscode_executable.cache_clear()
+        self.vscode_exe = find_vscode_executable()
+
     def on_tray_activated(self, reason):
         if reason == QSystemTrayIcon.ActivationReason.Trigger:
             self.show_window()
@@ -304,6 +646,9 @@ class VSCodeLauncher(QMainWindow):
         event.ignore()
         self.hide()
         self.trim_memory()
+        if self.tray_icon is None:
+            # Closed before the deferred tray setup ran; make sure it exists
+            self.setup_tray()
         self.tray_icon.showMessage(
             "VS Code Hub",
             "Minimised to tray. Click the shortcut again to open instantly.",
@@ -322,35 +667,48 @@ class VSCodeLauncher(QMainWindow):
             return []
 
     def save_ignored_folders(self):
+        # Drop entries that only differ by case/separators
+        unique = {}
+        for p in self.ignored_folders:
+            unique.setdefault(path_key(p), p)
+        self.ignored_folders = list(unique.values())
         with open('ignored_folders.json', 'w') as f:
             json.dump(self.ignored_folders, f, indent=4)
 
     def load_from_cache(self):
         if os.path.exists(CACHE_FILE):
             try:
-                with open(CACHE_FILE, 'r') as f:
-                    self.projects_data = json.load(f)
+                # Bytes in, like the scanner: orjson writes UTF-8, not the locale encoding
+                with open(CACHE_FILE, 'rb') as f:
+                    self.set_projects_data(json.loads(f.read()))
                 self.populate_projects()
                 self.count_label.setText(f"{len(self.projects_data)} projects (Cached)")
             except Exception as e:
-                logging.error(f"Cache load failed: {e}")
+                logging.error("Cache load failed: %s", e)
+
+    def set_projects_data(self, projects):
+        self.projects_data = projects
+        # Casefolded names are computed once per data change, not per keystroke
+        self._paths = [p['path'] for p in projects]
+        self._name_keys = [p['name'].casefold() for p in projects]
+        self._last_needle = None
+        self._filtered_idx = None
 
     def on_scan_finished(self, projects, vscode_path):
         self.vscode_exe = vscode_path
-        current_paths = [p['path'] for p in self.projects_data]
-        new_paths = [p['path'] for p in projects]
-        
-        if current_paths != new_paths:
-            self.projects_data = projects
-            self.filter_projects()
-            self.count_label.setText(f"{len(self.projects_data)} projects")
-        else:
-             self.count_label.setText(f"{len(self.projects_data)} projects")
+
+        # Rebind on any visible change, not just a different path list, so new
+        # icons and dates reach tiles that are already on screen
+        if tile_state(self.projects_data) != tile_state(projects):
+            # Only a scan that found changes invalidates the dialog's memoized icons
+            clear_icon_cache()
+            self.set_projects_data(projects)
+            self._apply_filter()
+        self.count_label.setText(f"{len(self.projects_data)} projects")
 
     def add_ignored_folder(self):
-        current_paths = [p['path'] for p in self.projects_data]
         try:
-            dialog = CustomFolderDialog(current_paths, self.ignored_folders, self)
+            dialog = CustomFolderDialog(list(self._paths), self.ignored_folders, self)
             if dialog.exec():
                 self.ignored_folders = dialog.selected_paths()
                 self.save_ignored_folders()
@@ -364,7 +722,7 @@ class VSCodeLauncher(QMainWindow):
 
         self.background_frame = QFrame(self)
         self.background_frame.setObjectName("backgroundFrame")
-        self.background_frame.setStyleSheet("#backgroundFrame { background-color: #1e1e1e; border-radius: 15px; }")
+        self.background_frame.setStyleSheet(WINDOW_QSS)
         self.setCentralWidget(self.background_frame)
         
         main_layout = QVBoxLayout(self.background_frame)
@@ -387,13 +745,11 @@ class VSCodeLauncher(QMainWindow):
             QScrollBar::handle:vertical:hover { background: #4e4e52; }
         """)
 
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._on_scroll)
+
         self.scroll_content = QWidget()
-        self.scroll_content.setStyleSheet("background: transparent;")
-        
-        # Grid Layout Setup
-        self.grid_layout = QGridLayout(self.scroll_content)
-        self.grid_layout.setSpacing(20)
-        self.grid_layout.setContentsMargins(30, 30, 30, 30)
+        self.scroll_content.setObjectName("projectGrid")
+        self.scroll_content.setStyleSheet(GRID_QSS)
 
         self.scroll_area.setWidget(self.scroll_content)
         main_layout.addWidget(self.scroll_area)
@@ -401,10 +757,7 @@ class VSCodeLauncher(QMainWindow):
     def create_header(self):
         header = QFrame()
         header.setFixedHeight(50)
-        header.setStyleSheet("""
-            QFrame { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #007acc, stop:1 #005a9e);
-                     border-top-left-radius: 14px; border-top-right-radius: 14px; }
-        """)
+        header.setObjectName("header")
         header.setMouseTracking(True)
         layout = QHBoxLayout(header)
         layout.setContentsMargins(20, 0, 5, 0)
@@ -416,15 +769,8 @@ class VSCodeLauncher(QMainWindow):
         self.count_label = QLabel("Loading...")
         self.count_label.setStyleSheet("font-size: 13px; color: rgba(255, 255, 255, 0.8); background: transparent; margin-right: 20px;")
         layout.addWidget(self.count_label)
-        
-        btn_style = """
-            QPushButton { background-color: transparent; border-radius: 5px; }
-            QPushButton:hover { background-color: rgba(255, 255, 255, 0.2); }
-            QPushButton:pressed { background-color: rgba(255, 255, 255, 0.1); }
-        """
 
         settings_btn = TitleBarButton("ignore")
-        settings_btn.setStyleSheet(btn_style)
         settings_btn.clicked.connect(self.add_ignored_folder)
         layout.addWidget(settings_btn)
 
@@ -432,15 +778,13 @@ class VSCodeLauncher(QMainWindow):
         controls_layout.setSpacing(0)
 
         minimize_btn = TitleBarButton("minimize")
-        minimize_btn.setStyleSheet(btn_style)
         minimize_btn.clicked.connect(self.showMinimized)
         
         self.maximize_btn = TitleBarButton("maximize")
-        self.maximize_btn.setStyleSheet(btn_style)
         self.maximize_btn.clicked.connect(self.toggle_maximize_restore)
         
         close_btn = TitleBarButton("close")
-        close_btn.setStyleSheet(btn_style + "QPushButton:hover { background-color: #E81123; }")
+        close_btn.setObjectName("closeBtn")
         close_btn.clicked.connect(self.close)
         
         controls_layout.addWidget(minimize_btn)
@@ -450,14 +794,15 @@ class VSCodeLauncher(QMainWindow):
         return header
 
     def toggle_maximize_restore(self):
-        if self.isMaximized():
-            self.showNormal()
-            self.background_frame.setStyleSheet("#backgroundFrame { background-color: #1e1e1e; border-radius: 15px; }")
-            self.header.setStyleSheet("QFrame { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #007acc, stop:1 #005a9e); border-top-left-radius: 14px; border-top-right-radius: 14px; }")
-        else:
+        maximized = not self.isMaximized()
+        if maximized:
             self.showMaximized()
-            self.background_frame.setStyleSheet("#backgroundFrame { background-color: #1e1e1e; border-radius: 0px; }")
-            self.header.setStyleSheet("QFrame { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #007acc, stop:1 #005a9e); border-top-left-radius: 0px; border-top-right-radius: 0px; }")
+        else:
+            self.showNormal()
+        for widget in (self.background_frame, self.header):
+            widget.setProperty("maximized", maximized)
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
 
     def mousePressEvent(self, event: QMouseEvent):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -496,46 +841,40 @@ class VSCodeLauncher(QMainWindow):
         super().resizeEvent(event)
 
     def populate_projects(self, projects_to_show=None):
-        # 1. Clean up existing widgets
-        for i in reversed(range(self.grid_layout.count())): 
-            widget = self.grid_layout.itemAt(i).widget()
-            if widget: widget.setParent(None)
-        
-        # 2. Reset any previous layout stretches
-        for r in range(self.grid_layout.rowCount()):
-            self.grid_layout.setRowStretch(r, 0)
-        for c in range(self.grid_layout.columnCount()):
-            self.grid_layout.setColumnStretch(c, 0)
-
         data_list = projects_to_show if projects_to_show is not None else self.projects_data
 
-        BUTTON_WIDTH, HORIZONTAL_SPACING = 180, self.grid_layout.horizontalSpacing()
-        margins = self.grid_layout.contentsMargins()
-        GRID_HORIZONTAL_MARGINS = margins.left() + margins.right()
+        viewport = self.scroll_area.viewport()
+        available_width = (viewport.width() or self.width()) - 2 * GRID_MARGIN
+        cols = max(1, (available_width + GRID_SPACING) // (TILE_WIDTH + GRID_SPACING))
+
+        viewport.setUpdatesEnabled(False)
         try:
-            viewport_width = self.scroll_area.viewport().width()
-            if viewport_width == 0: viewport_width = self.width()
-            available_width = viewport_width - GRID_HORIZONTAL_MARGINS
-        except AttributeError:
-            available_width = self.width() - GRID_HORIZONTAL_MARGINS
-        
-        cols = max(1, (available_width + HORIZONTAL_SPACING) // (BUTTON_WIDTH + HORIZONTAL_SPACING))
-
-        # 3. Add Buttons
-        last_row = 0
-        for i, proj_data in enumerate(data_list):
-            row, col = i // cols, i % cols
-            last_row = row
-            btn = ProjectButton(proj_data)
-            btn.clicked.connect(lambda checked, p=proj_data['path']: self.open_project(p))
-            self.grid_layout.addWidget(btn, row, col)
-        
-        # 4. Calculate optimal window width based on number of items
+            # 1. A new list or column count moves every tile, so release them all.
+            #    A plain relayout of the same list keeps the tiles that stay in view.
+            if data_list is not self._shown_projects or cols != self._cols:
+                for btn in self._bound.values():
+                    btn.hide()
+                    self._spare.append(btn)
+                self._bound = {}
+            self._shown_projects = data_list
+            self._cols = cols
+
+            # 2. Size the grid for every row so the scroll range never jumps,
+            #    then bind only the rows around the viewport
+            total_rows = -(-len(data_list) // cols)
+            self.scroll_content.setMinimumHeight(
+                2 * GRID_MARGIN + total_rows * TILE_HEIGHT + max(0, total_rows - 1) * GRID_SPACING)
+            self._bind_window()
+        finally:
+            viewport.setUpdatesEnabled(True)
+
+        # 3. Calculate optimal window width based on number of items
         num_items = len(data_list)
         if num_items > 0:
+            last_row = (num_items - 1) // cols
             # Calculate how many columns we actually need
             actual_cols = min(cols, num_items)
-            optimal_width = (actual_cols * BUTTON_WIDTH) + ((actual_cols - 1) * HORIZONTAL_SPACING) + GRID_HORIZONTAL_MARGINS + 20
+            optimal_width = (actual_cols * TILE_WIDTH) + ((actual_cols - 1) * GRID_SPACING) + 2 * GRID_MARGIN + 20
             
             # Add width for scrollbar if needed
             if last_row >= 3:  # If more than 3 rows, likely to have scrollbar
@@ -549,19 +888,81 @@ class VSCodeLauncher(QMainWindow):
                 new_width = max(min_width, min(max_width, optimal_width))
                 if abs(current_width - new_width) > 50:  # Only resize if significant difference
                     self.resize(new_width, self.height())
-            
-        # 5. Add spacer at bottom and right to force Top-Left alignment
-        self.grid_layout.setRowStretch(last_row + 1, 1)
-        self.grid_layout.setColumnStretch(cols, 1)
-    
+
+    def _bind_window(self):
+        """Binds buttons to the rows in view (plus overscan) and recycles the rest."""
+        row_height = TILE_HEIGHT + GRID_SPACING
+        top = self.scroll_area.verticalScrollBar().value()
+        bottom = top + (self.scroll_area.viewport().height() or self.height())
+        first_row = max(0, (top - GRID_MARGIN) // row_height - OVERSCAN_ROWS)
+        last_row = (bottom - GRID_MARGIN) // row_height + OVERSCAN_ROWS
+
+        count = len(self._shown_projects)
+        start = min(count, first_row * self._cols)
+        end = min(count, (last_row + 1) * self._cols)
+
+        # Tiles that left the window become spares for the newly exposed rows
+        for i in [i for i in self._bound if i < start or i >= end]:
+            btn = self._bound.pop(i)
+            btn.hide()
+            self._spare.append(btn)
+
+        for i in range(start, end):
+            if i in self._bound:
+                continue
+            if self._spare:
+                btn = self._spare.pop()
+            else:
+                btn = ProjectButton(self.scroll_content)
+                btn.clicked.connect(self._on_project_clicked)
+            btn.update_for(self._shown_projects[i])
+            row, col = divmod(i, self._cols)
+            btn.move(GRID_MARGIN + col * (TILE_WIDTH + GRID_SPACING), GRID_MARGIN + row * row_height)
+            btn.show()
+            self._bound[i] = btn
+
+    def _on_scroll(self, value):
+        viewport = self.scroll_area.viewport()
+        viewport.setUpdatesEnabled(False)
+        try:
+            self._bind_window()
+        finally:
+            viewport.setUpdatesEnabled(True)
+
+    def _on_project_clicked(self):
+        self.open_project(self.sender().project_path)
+
     def filter_projects(self):
-        search_text = self.search_input.text().lower()
-        filtered = [p for p in self.projects_data if search_text in p['name'].lower()]
-        self.populate_projects(filtered)
+        self.search_timer.start()
+
+    def _apply_filter(self):
+        needle = self.search_input.text().casefold()
+        keys = self._name_keys
+        # Typing more characters can only narrow the previous matches
+        if self._filtered_idx is not None and needle.startswith(self._last_needle):
+            candidates = self._filtered_idx
+        else:
+            candidates = range(len(keys))
+        idx = [i for i in candidates if needle in keys[i]]
+
+        unchanged = idx == self._filtered_idx
+        self._last_needle = needle
+        self._filtered_idx = idx
+        if not unchanged:
+            self.populate_projects([self.projects_data[i] for i in idx])
+
+    def _relayout(self):
+        # Keep the current filter when the window is resized
+        self.populate_projects(self._shown_projects)
     
+    def launch_vscode(self, path):
+        subprocess.Popen([self.vscode_exe, path], creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0)
+
     def open_project(self, path):
         # 1. Set the text
         self.search_input.setText("")
+        self.search_timer.stop()
+        self._apply_filter()
         
         # 2. Force PyQt to process the change immediately.
         # This makes the app wait until the text is set and the grid is filtered 
@@ -570,14 +971,21 @@ class VSCodeLauncher(QMainWindow):
 
         # --- The rest of your logic follows below ---
         if not self.vscode_exe:
-            scanner = ProjectScannerWorker([])
-            self.vscode_exe = scanner.find_vscode_executable()
+            self.vscode_exe = find_vscode_executable()
 
         if not self.vscode_exe:
             QMessageBox.critical(self, "Error", "Could not find VS Code executable (Code.exe).")
             return
         try:
-            subprocess.Popen([self.vscode_exe, path], creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0)
+            try:
+                self.launch_vscode(path)
+            except FileNotFoundError:
+                # Cached path went stale (VS Code moved/updated): re-detect once and retry
+                find_vscode_executable.cache_clear()
+                self.vscode_exe = find_vscode_executable()
+                if not self.vscode_exe:
+                    raise
+                self.launch_vscode(path)
             self.hide()
             self.trim_memory()
         except Exception as e:
@@ -585,27 +993,77 @@ class VSCodeLauncher(QMainWindow):
 
 
 
+def _configure_logging():
+    # Done from main() so importing this module doesn't touch launcher.log.
+    # delay=True defers opening the file to the first record, so a clean start does no log I/O.
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    handler = RotatingFileHandler('launcher.log', maxBytes=256_000, backupCount=2, encoding='utf-8', delay=True)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+
+def create_instance_mutex():
+    """Returns (handle, already_running); (None, None) if it can't be determined."""
+    if sys.platform != 'win32':
+        return None, None
+    from ctypes import wintypes
+    # Private WinDLL so the argtypes don't leak into ctypes.windll, and
+    # use_last_error so the error code is captured right after the call
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    kernel32.CreateMutexW.argtypes = (wintypes.LPVOID, wintypes.BOOL, wintypes.LPCWSTR)
+    kernel32.CreateMutexW.restype = wintypes.HANDLE
+    handle = kernel32.CreateMutexW(None, False, MUTEX_NAME)
+    if not handle:
+        return None, None
+    return handle, ctypes.get_last_error() == ERROR_ALREADY_EXISTS
+
+def send_show_command(wait_ms):
+    """Asks a running instance to show its window; False if none answered."""
+    socket = QLocalSocket()
+    socket.connectToServer(SOCKET_NAME)
+    if not socket.waitForConnected(wait_ms):
+        return False
+    socket.write(b"SHOW")
+    socket.flush()
+    socket.waitForBytesWritten(1000)
+    return True
+
 def main():
+    _configure_logging()
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False) 
 
     # --- SINGLE INSTANCE CHECK ---
-    socket = QLocalSocket()
-    socket.connectToServer(SOCKET_NAME)
-    
-    if socket.waitForConnected(500):
-        # App is already running. Send "SHOW" command and quit this new instance.
-        socket.write(b"SHOW")
-        socket.flush()
-        socket.waitForBytesWritten(1000)
+    # On Windows a named mutex answers "am I first?" without a socket round trip.
+    # The handle is kept alive for the whole process; Windows releases it on exit.
+    instance_mutex, already_running = create_instance_mutex()
+
+    if already_running:
+        # The owner may still be starting up and not listening yet, so keep
+        # trying briefly instead of dropping this launch
+        deadline = monotonic() + SHOW_RETRY_SECONDS
+        while not send_show_command(50):
+            if monotonic() >= deadline:
+                logging.error("Running instance did not accept the SHOW command")
+                break
+            sleep(0.05)
         sys.exit(0)
-    
+
+    # No mutex available (non-Windows): fall back to probing the socket
+    if already_running is None and send_show_command(500):
+        sys.exit(0)
+
     # If we are here, we are the first instance. Create Server.
     server = QLocalServer()
     # Cleanup previous socket file if it exists (crashed)
     QLocalServer.removeServer(SOCKET_NAME)
     server.listen(SOCKET_NAME)
     
+    # Room for a few hundred 48px project icons plus Qt's own style pixmaps (KB)
+    QPixmapCache.setCacheLimit(32 * 1024)
+
     app.setStyle('Fusion')
     font = QFont("Segoe UI", 10)
     app.setFont(font)